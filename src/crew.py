@@ -1,32 +1,54 @@
 """
 CrewAI multi-agent system for LLM mental health research.
 """
+import functools
+import json
 import os
+import re
+import threading
 import time
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, Optional
 import yaml
 from pathlib import Path
 from loguru import logger
 
-from crewai import Agent, Crew, Task, Process, LLM
-from crewai_tools import SerperDevTool
-
 from .models import CrewExecutionResult
 
+if TYPE_CHECKING:
+    # crewai pulls in litellm and friends; import it only where it's used
+    from crewai import Agent, Crew, Task, LLM
+
+try:
+    # libyaml-backed loader is several times faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+def _resolve_model_name() -> str:
+    """Return the configured Gemini model name with the LiteLLM prefix."""
+    # Use gemini/ prefix for LiteLLM
+    model_name = os.getenv("GEMINI_MODEL_NAME", "gemini/gemini-1.5-pro")
+    if not model_name.startswith("gemini/"):
+        model_name = f"gemini/{model_name}"
+    return model_name
+
 
 class MentalHealthResearchCrew:
     """
     Multi-agent crew for researching LLM applications in mental health.
     """
     
-    def __init__(self, config_dir: str = "config"):
+    def __init__(self, config_dir: str = "config", model_name: Optional[str] = None):
         """
         Initialize the research crew.
         
         Args:
             config_dir: Directory containing configuration files
+            model_name: Gemini model name (defaults to env var)
         """
         self.config_dir = Path(config_dir)
+        self.model_name = model_name or _resolve_model_name()
         
         # Load configurations
         self.agents_config = self._load_yaml(self.config_dir / "agents.yaml")
@@ -36,7 +58,8 @@ class MentalHealthResearchCrew:
         self.llm = self._init_llm()
         
         # Initialize tools
-        self.search_tool = SerperDevTool(
+        from .search_tool import BatchSerperDevTool
+        self.search_tool = BatchSerperDevTool(
             n_results=int(os.getenv("MAX_SEARCH_RESULTS", 10))
         )
         
@@ -49,103 +72,142 @@ class MentalHealthResearchCrew:
         # Create crew
         self.crew = self._create_crew()
         
-        logger.info("MentalHealthResearchCrew initialized successfully")
+        logger.info(f"MentalHealthResearchCrew initialized successfully (YAML loader: {_YamlLoader.__name__})")
     
     def _load_yaml(self, filepath: Path) -> Dict[str, Any]:
-        """Load YAML configuration file."""
+        """
+        Load YAML configuration file.
+        
+        The parsed result is cached next to the source as ``<name>.yaml.json``
+        and reused for as long as the YAML file has not been modified.
+        """
+        cache = filepath.with_suffix('.yaml.json')
+        try:
+            if cache.exists() and cache.stat().st_mtime >= filepath.stat().st_mtime:
+                with open(cache, 'r') as f:
+                    return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable config cache {cache}: {e}")
+        
         try:
             with open(filepath, 'r') as f:
-                return yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YamlLoader)
         except Exception as e:
             logger.error(f"Failed to load {filepath}: {e}")
             raise
+        
+        self._write_json_cache(cache, data)
+        return data
     
-    def _init_llm(self) -> LLM:
-        """Initialize the language model."""
-        # Use gemini/ prefix for LiteLLM
-        model_name = os.getenv("GEMINI_MODEL_NAME", "gemini/gemini-1.5-pro")
-        if not model_name.startswith("gemini/"):
-            model_name = f"gemini/{model_name}"
+    @staticmethod
+    def _load_yaml_header(filepath: Path, max_bytes: int = 4096) -> Dict[str, Any]:
+        """
+        Parse only the top-level entries that fit in the first ``max_bytes``.
+        
+        Useful for cheaply inspecting a config before committing to a full
+        ``_load_yaml``. The last top-level entry in a truncated window may be
+        incomplete, so it is dropped.
+        
+        Args:
+            filepath: YAML file to inspect
+            max_bytes: Size of the window read from the start of the file
             
-        return LLM(
-            model=model_name,
-            api_key=os.getenv("GEMINI_API_KEY")
-        )
+        Returns:
+            Mapping of the complete top-level entries in the window
+        """
+        with open(filepath, 'rb') as f:
+            head = f.read(max_bytes + 1)
+        
+        truncated = len(head) > max_bytes
+        text = head[:max_bytes].decode('utf-8', errors='ignore')
+        
+        if truncated:
+            starts = [m.start() for m in re.finditer(r'^[^\s#]', text, re.MULTILINE)]
+            text = text[:starts[-1]] if starts else ""
+        
+        return yaml.load(text, Loader=_YamlLoader) or {}
     
-    def _create_agents(self) -> Dict[str, Agent]:
-        """Create the research agents."""
-        agents = {}
-        
-        # Researcher agent with search capabilities
-        agents['researcher'] = Agent(
-            role=self.agents_config['researcher']['role'],
-            goal=self.agents_config['researcher']['goal'],
-            backstory=self.agents_config['researcher']['backstory'],
-            verbose=self.agents_config['researcher']['verbose'],
-            allow_delegation=self.agents_config['researcher']['allow_delegation'],
-            max_iter=self.agents_config['researcher']['max_iter'],
-            memory=self.agents_config['researcher']['memory'],
-            tools=[self.search_tool],
-            llm=self.llm
-        )
+    def _write_json_cache(self, cache: Path, data: Dict[str, Any]) -> None:
+        """Atomically write parsed config data to its JSON cache file."""
+        tmp = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp, cache)
+        except (OSError, TypeError, ValueError) as e:
+            # Caching is best-effort (read-only checkout, non-JSON values, ...)
+            logger.warning(f"Could not write config cache {cache}: {e}")
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+    
+    def _init_llm(self) -> "LLM":
+        """Initialize the language model."""
+        from crewai import LLM
         
-        # Analyst agent
-        agents['analyst'] = Agent(
-            role=self.agents_config['analyst']['role'],
-            goal=self.agents_config['analyst']['goal'],
-            backstory=self.agents_config['analyst']['backstory'],
-            verbose=self.agents_config['analyst']['verbose'],
-            allow_delegation=self.agents_config['analyst']['allow_delegation'],
-            max_iter=self.agents_config['analyst']['max_iter'],
-            memory=self.agents_config['analyst']['memory'],
-            llm=self.llm
+        llm = LLM(
+            model=self.model_name,
+            api_key=os.getenv("GEMINI_API_KEY")
         )
         
-        # Report writer agent
-        agents['report_writer'] = Agent(
-            role=self.agents_config['report_writer']['role'],
-            goal=self.agents_config['report_writer']['goal'],
-            backstory=self.agents_config['report_writer']['backstory'],
-            verbose=self.agents_config['report_writer']['verbose'],
-            allow_delegation=self.agents_config['report_writer']['allow_delegation'],
-            max_iter=self.agents_config['report_writer']['max_iter'],
-            memory=self.agents_config['report_writer']['memory'],
-            llm=self.llm
-        )
+        # Optional semantic response cache (shared across runs of a cached crew)
+        if os.getenv("LLM_CACHE_ENABLED", "false").lower() == "true":
+            from .llm_cache import CachingLLM, load_default_embedder
+            
+            llm = CachingLLM(
+                llm,
+                embed_fn=load_default_embedder(),
+                threshold=float(os.getenv("LLM_CACHE_THRESHOLD", 0.92)),
+                ttl_seconds=float(os.getenv("LLM_CACHE_TTL_HOURS", 24)) * 3600
+            )
+            logger.info("LLM response cache enabled")
         
-        return agents
+        return llm
     
-    def _create_tasks(self) -> Dict[str, Task]:
-        """Create the research tasks."""
-        tasks = {}
+    def _create_agents(self) -> Dict[str, "Agent"]:
+        """Create the research agents defined in agents.yaml."""
+        from crewai import Agent
         
-        # Search task
-        tasks['search'] = Task(
-            description=self.tasks_config['search_research']['description'],
-            expected_output=self.tasks_config['search_research']['expected_output'],
-            agent=self.agents['researcher']
-        )
+        # Tools granted per agent; agents not listed get none
+        tools_by_agent = {
+            'researcher': [self.search_tool],
+        }
         
-        # Analysis task (depends on search)
-        tasks['analyze'] = Task(
-            description=self.tasks_config['analyze_findings']['description'],
-            expected_output=self.tasks_config['analyze_findings']['expected_output'],
-            agent=self.agents['analyst'],
-            context=[tasks['search']]  # Waits for search to complete
-        )
+        return {
+            name: Agent(**spec, tools=tools_by_agent.get(name, []), llm=self.llm)
+            for name, spec in self.agents_config.items()
+        }
+    
+    def _create_tasks(self) -> Dict[str, "Task"]:
+        """
+        Create the research tasks defined in tasks.yaml, in file order.
         
-        # Report generation task (depends on analysis)
-        tasks['report'] = Task(
-            description=self.tasks_config['generate_report']['description'],
-            expected_output=self.tasks_config['generate_report']['expected_output'],
-            agent=self.agents['report_writer'],
-            context=[tasks['search'], tasks['analyze']]  # Waits for both
-        )
+        Each task names its ``agent`` and, optionally, the earlier tasks it
+        takes as ``context``. Descriptions are kept static; CrewAI appends
+        context outputs after the task prompt, which keeps the agent system
+        prompt and task text a stable prefix that the provider can serve
+        from its prompt cache.
+        """
+        from crewai import Task
+        
+        tasks = {}
+        for name, spec in self.tasks_config.items():
+            spec = dict(spec)
+            spec['agent'] = self.agents[spec['agent']]
+            
+            # Waits for the listed tasks to complete
+            if 'context' in spec:
+                spec['context'] = [tasks[dep] for dep in spec['context']]
+            
+            tasks[name] = Task(**spec)
         
         return tasks
     
-    def _create_crew(self) -> Crew:
+    def _create_crew(self) -> "Crew":
         """Create the crew with sequential process."""
+        from crewai import Crew, Process
+        
         return Crew(
             agents=list(self.agents.values()),
             tasks=list(self.tasks.values()),
@@ -156,6 +218,10 @@ class MentalHealthResearchCrew:
             planning_llm=self.llm  # Explicitly use Gemini for planning
         )
     
+    def _report_text(self, result: Any) -> str:
+        """Return the report text, preferring the raw output over str()."""
+        return getattr(result, 'raw', None) or getattr(result, 'output', None) or str(result)
+    
     def execute(self) -> CrewExecutionResult:
         """
         Execute the research crew.
@@ -175,11 +241,12 @@ class MentalHealthResearchCrew:
             execution_time = time.time() - start_time
             
             # Extract the final report
-            report = str(result)
+            report = self._report_text(result)
             
             logger.info(f"Crew execution completed in {execution_time:.2f}s")
             
-            return CrewExecutionResult(
+            # Fields are produced internally, so skip validation
+            return CrewExecutionResult.model_construct(
                 execution_id=execution_id,
                 status="success",
                 report=report,
@@ -218,11 +285,12 @@ class MentalHealthResearchCrew:
             execution_time = time.time() - start_time
             
             # Extract the final report
-            report = str(result)
+            report = self._report_text(result)
             
             logger.info(f"Async crew execution completed in {execution_time:.2f}s")
             
-            return CrewExecutionResult(
+            # Fields are produced internally, so skip validation
+            return CrewExecutionResult.model_construct(
                 execution_id=execution_id,
                 status="success",
                 report=report,
@@ -241,3 +309,30 @@ class MentalHealthResearchCrew:
                 error=error_msg,
                 execution_time_seconds=execution_time
             )
+
+
+_crew_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4)
+def _build_crew(config_dir: str, model_name: str) -> MentalHealthResearchCrew:
+    return MentalHealthResearchCrew(config_dir=config_dir, model_name=model_name)
+
+
+def get_crew(config_dir: str = "config", model_name: Optional[str] = None) -> MentalHealthResearchCrew:
+    """
+    Return a shared research crew, building it on first use.
+    
+    Crews are cached per ``(config_dir, model_name)`` so repeated runs reuse
+    the same agents, tasks and LLM client instead of rebuilding them.
+    
+    Args:
+        config_dir: Directory containing configuration files
+        model_name: Gemini model name (defaults to env var)
+        
+    Returns:
+        The cached MentalHealthResearchCrew
+    """
+    key = (str(Path(config_dir)), model_name or _resolve_model_name())
+    with _crew_lock:
+        return _build_crew(*key)
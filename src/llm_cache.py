@@ -0,0 +1,233 @@
+"""
+Semantic response cache for the crew's language model.
+"""
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+from crewai.llms.base_llm import BaseLLM
+
+
+# Returns None for text the embedder can't represent faithfully (e.g. too long)
+EmbedFn = Callable[[str], Optional[Sequence[float]]]
+
+
+@dataclass
+class _CacheEntry:
+    """A cached LLM response."""
+    context_key: str
+    vector: Optional[np.ndarray]
+    response: str
+    created: float
+
+
+def load_default_embedder() -> Optional[EmbedFn]:
+    """
+    Load a local sentence-transformers embedder.
+
+    Returns:
+        Embedding function, or None if sentence-transformers is not installed
+    """
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        logger.warning("sentence-transformers not installed, LLM cache will only match identical prompts")
+        return None
+
+    model = SentenceTransformer("all-MiniLM-L6-v2")
+
+    def embed(text: str) -> Optional[Sequence[float]]:
+        # The model silently truncates past max_seq_length, which would make
+        # long texts with a shared prefix look identical
+        if len(model.tokenizer(text)["input_ids"]) > model.max_seq_length:
+            return None
+        return model.encode(text, normalize_embeddings=True)
+
+    return embed
+
+
+class CachingLLM(BaseLLM):
+    """
+    Wraps an LLM and reuses responses for identical or near-identical prompts.
+
+    A semantic hit requires everything except the final user message (system
+    prompt, task, earlier agent steps and tool results) to match exactly;
+    only that final message is embedded and compared by cosine similarity
+    against ``threshold``. Messages the embedder can't represent only match
+    exactly. Calls that pass tools or a response model are forwarded uncached.
+    """
+
+    def __init__(
+        self,
+        base: BaseLLM,
+        embed_fn: Optional[EmbedFn] = None,
+        threshold: float = 0.92,
+        ttl_seconds: float = 24 * 3600,
+        max_entries: int = 1000
+    ):
+        """
+        Initialize the caching wrapper.
+
+        Args:
+            base: The LLM that handles cache misses
+            embed_fn: Function mapping a prompt to an embedding (exact match only if None)
+            threshold: Minimum cosine similarity for a semantic hit
+            ttl_seconds: How long a cached response stays valid
+            max_entries: Maximum number of cached responses (LRU eviction)
+        """
+        self._base = base
+        self.embed_fn = embed_fn
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        super().__init__(
+            model=base.model,
+            temperature=base.temperature,
+            api_key=base.api_key,
+            base_url=base.base_url,
+            provider=base.provider,
+            stop=base.stop
+        )
+
+    @property
+    def stop(self) -> List[str]:
+        """Stop words, shared with the wrapped LLM."""
+        return self._base.stop
+
+    @stop.setter
+    def stop(self, value: List[str]) -> None:
+        self._base.stop = value
+
+    def call(
+        self,
+        messages: Any,
+        tools: Optional[List[Any]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[dict] = None,
+        **kwargs: Any
+    ) -> Any:
+        """Return a cached response if one matches, otherwise call the base LLM."""
+        if tools or available_functions or kwargs.get("response_model"):
+            return self._base.call(
+                messages,
+                tools=tools,
+                callbacks=callbacks,
+                available_functions=available_functions,
+                **kwargs
+            )
+
+        context, query = self._split_prompt(messages)
+        context_key = self._hash(context)
+        key = self._hash(f"{context_key}\n{query}")
+        vector = self._embed(query)
+
+        cached = self._lookup(key, context_key, vector)
+        if cached is not None:
+            self.hits += 1
+            logger.info(f"LLM cache hit (hit rate: {self.hit_rate:.0%})")
+            return cached
+
+        self.misses += 1
+        response = self._base.call(messages, callbacks=callbacks, **kwargs)
+
+        if isinstance(response, str):
+            self._store(key, context_key, vector, response)
+        return response
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of cacheable calls served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def _split_prompt(self, messages: Any) -> Tuple[str, str]:
+        """
+        Split a prompt into its fixed context and the final user message.
+
+        Returns:
+            Tuple of (flattened preceding messages, final user message text)
+        """
+        if isinstance(messages, str):
+            return "", messages
+
+        if messages and messages[-1].get("role") == "user":
+            *context, last = messages
+            query = str(last.get("content", ""))
+        else:
+            # No trailing user message to compare; match the transcript exactly
+            context, query = messages, ""
+
+        return "\n".join(f"{m.get('role', '')}: {m.get('content', '')}" for m in context), query
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        """Embed and normalize text, or return None if it can't be embedded."""
+        if self.embed_fn is None or not text:
+            return None
+
+        embedding = self.embed_fn(text)
+        if embedding is None:
+            return None
+
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _lookup(self, key: str, context_key: str, vector: Optional[np.ndarray]) -> Optional[str]:
+        """Find a live cached response for the prompt."""
+        now = time.monotonic()
+        for stale_key in [k for k, e in self._entries.items() if now - e.created > self.ttl_seconds]:
+            del self._entries[stale_key]
+
+        if key not in self._entries and vector is not None:
+            keys = [
+                k for k, e in self._entries.items()
+                if e.context_key == context_key and e.vector is not None
+            ]
+            if keys:
+                scores = np.stack([self._entries[k].vector for k in keys]) @ vector
+                best = int(np.argmax(scores))
+                if scores[best] >= self.threshold:
+                    key = keys[best]
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        self._entries.move_to_end(key)
+        return entry.response
+
+    def _store(self, key: str, context_key: str, vector: Optional[np.ndarray], response: str) -> None:
+        """Cache a response, evicting the least recently used entry if full."""
+        self._entries[key] = _CacheEntry(
+            context_key=context_key,
+            vector=vector,
+            response=response,
+            created=time.monotonic()
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def supports_function_calling(self) -> bool:
+        return self._base.supports_function_calling()
+
+    def supports_stop_words(self) -> bool:
+        return self._base.supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        return self._base.get_context_window_size()
+
+    def get_token_usage_summary(self) -> Any:
+        return self._base.get_token_usage_summary()
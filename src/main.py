@@ -11,8 +11,8 @@ from dotenv import load_dotenv
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.crew import MentalHealthResearchCrew
-from src.telegram_notifier import TelegramNotifier
+from src.crew import get_crew
+from src.telegram_notifier import TelegramNotifier, close_shared_bot
 from src.scheduler import ResearchScheduler
 
 
@@ -24,25 +24,80 @@ def setup_logging():
     # Remove default logger
     logger.remove()
     
-    # Add console logger
+    # Add console logger (enqueued: formatting runs on a background thread)
     logger.add(
         sys.stdout,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
-        level=log_level
+        level=log_level,
+        enqueue=True,
+        backtrace=False,
+        diagnose=False
     )
     
-    # Add file logger
+    # Add file logger (enqueued: disk writes don't block agent steps)
     logger.add(
         log_file,
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function} - {message}",
         level=log_level,
         rotation="10 MB",
-        retention="1 week"
+        retention="1 week",
+        enqueue=True,
+        backtrace=False,
+        diagnose=False
     )
     
     logger.info("Logging configured")
 
 
+def event_loop_factory():
+    """
+    Return a factory for a faster event loop implementation, if available.
+    
+    Uses uvloop on POSIX and winloop on Windows. If neither is installed,
+    returns None and the stock asyncio loop is used.
+    """
+    try:
+        if sys.platform == "win32":
+            import winloop as loop_impl
+        else:
+            import uvloop as loop_impl
+    except ImportError:
+        logger.debug("Using default asyncio event loop")
+        return None
+    
+    logger.info(f"Using {loop_impl.__name__} event loop")
+    return loop_impl.new_event_loop
+
+
+def run_async(coro):
+    """Run a CLI coroutine to completion on the preferred event loop."""
+    loop_factory = event_loop_factory()
+    
+    # Passing a loop factory avoids the deprecated global event loop policy
+    if hasattr(asyncio, "Runner"):
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            return runner.run(run_and_close(coro))
+    
+    # Python 3.10 has no asyncio.Runner
+    if loop_factory is None:
+        return asyncio.run(run_and_close(coro))
+    
+    loop = loop_factory()
+    try:
+        return loop.run_until_complete(run_and_close(coro))
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+async def run_and_close(coro):
+    """Run a CLI coroutine, then close the shared Telegram connection pool."""
+    try:
+        return await coro
+    finally:
+        await close_shared_bot()
+
+
 async def test_connection():
     """Test Telegram bot connection."""
     logger.info("Testing Telegram connection...")
@@ -63,7 +118,7 @@ async def run_once():
     
     try:
         # Initialize crew and notifier
-        crew = MentalHealthResearchCrew()
+        crew = get_crew()
         notifier = TelegramNotifier()
         
         # Execute research
@@ -111,15 +166,15 @@ def main():
     
     if mode == "test":
         # Test Telegram connection
-        asyncio.run(test_connection())
+        run_async(test_connection())
         
     elif mode == "once":
         # Run once
-        asyncio.run(run_once())
+        run_async(run_once())
         
     elif mode == "schedule":
         # Run scheduled
-        asyncio.run(run_scheduled())
+        run_async(run_scheduled())
         
     else:
         print("Usage: python -m src.main [test|once|schedule]")
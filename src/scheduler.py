@@ -2,16 +2,34 @@
 Scheduler for periodic research crew execution.
 """
 import asyncio
-from datetime import datetime
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.interval import IntervalTrigger
-from apscheduler.triggers.cron import CronTrigger
+import functools
+import signal
+from typing import TYPE_CHECKING, Optional
 from loguru import logger
 import os
 
-from .crew import MentalHealthResearchCrew
+from .crew import get_crew
 from .telegram_notifier import TelegramNotifier
 
+if TYPE_CHECKING:
+    from apscheduler.triggers.cron import CronTrigger
+
+
+@functools.lru_cache(maxsize=16)
+def _cron_trigger(cron_expression: str) -> "CronTrigger":
+    """Build (and cache) a CronTrigger from a 5-field cron expression."""
+    from apscheduler.triggers.cron import CronTrigger
+    
+    minute, hour, day, month, day_of_week = cron_expression.split()
+    
+    return CronTrigger(
+        minute=minute,
+        hour=hour,
+        day=day,
+        month=month,
+        day_of_week=day_of_week
+    )
+
 
 class ResearchScheduler:
     """
@@ -20,9 +38,13 @@ class ResearchScheduler:
     
     def __init__(self):
         """Initialize the scheduler."""
+        from apscheduler.schedulers.asyncio import AsyncIOScheduler
+        
         self.scheduler = AsyncIOScheduler()
-        self.crew = MentalHealthResearchCrew()
+        self.crew = get_crew()
         self.notifier = TelegramNotifier()
+        self._initial_run: Optional[asyncio.Task] = None
+        self._run_lock = asyncio.Lock()
         
         # Get schedule configuration
         self.interval_minutes = int(os.getenv("SCHEDULE_INTERVAL_MINUTES", 1440))
@@ -31,6 +53,17 @@ class ResearchScheduler:
         logger.info(f"Scheduler initialized (interval: {self.interval_minutes} minutes, enabled: {self.enabled})")
     
     async def execute_research(self):
+        """Execute the research crew, skipping if a run is already in progress."""
+        # The boot run is outside APScheduler's max_instances guard, and all
+        # runs share one memoized crew, so only one may run at a time
+        if self._run_lock.locked():
+            logger.warning("Research execution already in progress, skipping this run")
+            return
+        
+        async with self._run_lock:
+            await self._execute_research()
+    
+    async def _execute_research(self):
         """Execute the research crew and send notifications."""
         logger.info("Scheduled research execution started")
         
@@ -60,6 +93,8 @@ class ResearchScheduler:
             logger.warning("Scheduler is disabled in configuration")
             return
         
+        from apscheduler.triggers.interval import IntervalTrigger
+        
         # Add the job with interval trigger
         self.scheduler.add_job(
             self.execute_research,
@@ -67,10 +102,13 @@ class ResearchScheduler:
             id='research_job',
             name='Mental Health LLM Research',
             replace_existing=True,
-            next_run_time=datetime.now()  # Run immediately on start
+            misfire_grace_time=None
         )
         
         self.scheduler.start()
+        
+        # Run immediately on start, independent of the interval schedule
+        self._initial_run = asyncio.create_task(self.execute_research())
         logger.info(f"Scheduler started (runs every {self.interval_minutes} minutes)")
     
     def start_with_cron(self, cron_expression: str = "0 9 * * *"):
@@ -88,18 +126,9 @@ class ResearchScheduler:
             logger.warning("Scheduler is disabled in configuration")
             return
         
-        # Parse cron expression
-        minute, hour, day, month, day_of_week = cron_expression.split()
-        
         self.scheduler.add_job(
             self.execute_research,
-            trigger=CronTrigger(
-                minute=minute,
-                hour=hour,
-                day=day,
-                month=month,
-                day_of_week=day_of_week
-            ),
+            trigger=_cron_trigger(cron_expression),
             id='research_job',
             name='Mental Health LLM Research',
             replace_existing=True
@@ -110,17 +139,36 @@ class ResearchScheduler:
     
     def stop(self):
         """Stop the scheduler."""
+        if self._initial_run is not None and not self._initial_run.done():
+            self._initial_run.cancel()
+        
         self.scheduler.shutdown()
         logger.info("Scheduler stopped")
     
     async def run_forever(self):
-        """Run the scheduler indefinitely."""
+        """Run the scheduler until SIGINT or SIGTERM is received."""
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        
+        signals = (signal.SIGINT, signal.SIGTERM)
+        for sig in signals:
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except NotImplementedError:
+                # Not supported on Windows; Ctrl+C still cancels the run
+                pass
+        
         self.start()
         
         try:
-            # Keep the scheduler running
-            while True:
-                await asyncio.sleep(60)
-        except KeyboardInterrupt:
+            # Park until a shutdown signal arrives; jobs run on their own timers
+            await stop_event.wait()
             logger.info("Received shutdown signal")
-            self.stop()
+        finally:
+            for sig in signals:
+                try:
+                    loop.remove_signal_handler(sig)
+                except NotImplementedError:
+                    pass
+            if self.scheduler.running:
+                self.stop()
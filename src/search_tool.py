@@ -0,0 +1,63 @@
+"""
+Batched web search tool for the researcher agent.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Type
+
+from loguru import logger
+from pydantic import BaseModel, Field
+from crewai_tools import SerperDevTool
+
+
+class BatchSerperDevToolSchema(BaseModel):
+    """Input for BatchSerperDevTool."""
+    search_queries: List[str] = Field(
+        ..., description="Independent search queries to run together, one per item"
+    )
+
+
+class BatchSerperDevTool(SerperDevTool):
+    """
+    SerperDevTool variant that runs several independent queries concurrently.
+    """
+
+    name: str = "Search the internet with Serper"
+    description: str = (
+        "A tool that can be used to search the internet. Pass every independent "
+        "query you want to run as search_queries; they are executed together "
+        "and results are returned keyed by query."
+    )
+    args_schema: Type[BaseModel] = BatchSerperDevToolSchema
+    max_concurrency: int = 5  # Stay within Serper's rate limit
+
+    def _run(self, **kwargs: Any) -> Dict[str, Any]:
+        """Execute all queries concurrently and return results per query."""
+        queries = kwargs.get("search_queries") or []
+        if isinstance(queries, str):
+            queries = [queries]
+
+        # Accept the single-query form too, in case the agent uses it
+        single_query = kwargs.get("search_query") or kwargs.get("query")
+        if single_query:
+            queries = [*queries, single_query]
+
+        queries = list(dict.fromkeys(queries))
+        if not queries:
+            raise ValueError("search_queries is required")
+
+        search_type = kwargs.get("search_type", self.search_type)
+
+        def search(query: str) -> Any:
+            try:
+                return super(BatchSerperDevTool, self)._run(
+                    search_query=query,
+                    search_type=search_type
+                )
+            except Exception as e:
+                logger.warning(f"Search failed for '{query}': {e}")
+                return {"error": str(e)}
+
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(queries))) as pool:
+            results = list(pool.map(search, queries))
+
+        return dict(zip(queries, results))
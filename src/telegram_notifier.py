@@ -2,20 +2,85 @@
 Telegram notification system with async support and message chunking.
 """
 import asyncio
+import atexit
 import os
-from typing import Optional, List
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
 from loguru import logger
 import telegram
-from telegram.error import TelegramError
+from telegram.error import RetryAfter, TelegramError
 from telegram.constants import ParseMode
 
 
+# Shared Bots keyed by (event loop, token); see _get_bot
+_shared_bots: Dict[Tuple[Optional[asyncio.AbstractEventLoop], str], telegram.Bot] = {}
+_sync_notifier: Optional["TelegramNotifier"] = None
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_bot(token: str) -> telegram.Bot:
+    """
+    Return the shared Bot for the given token and the running event loop.
+    
+    Reusing one Bot keeps its underlying httpx connection pool alive, so
+    repeated notifications skip the TCP/TLS handshake. Pooled connections
+    are bound to the loop that opened them, so each event loop keeps its
+    own Bot; switching between loops reuses rather than replaces them.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    
+    # A closed loop's connections can no longer be shut down; just forget them
+    for key in [k for k in _shared_bots if k[0] is not None and k[0].is_closed()]:
+        del _shared_bots[key]
+    
+    bot = _shared_bots.get((loop, token))
+    if bot is None:
+        bot = _shared_bots[(loop, token)] = telegram.Bot(token=token)
+    return bot
+
+
+async def close_shared_bot() -> None:
+    """
+    Close the connection pools of the shared Bots used on the running loop.
+    
+    Must be awaited on that loop before it is closed; Bots belonging to
+    other loops are left untouched.
+    """
+    loop = asyncio.get_running_loop()
+    for key in [k for k in _shared_bots if k[0] is loop]:
+        await _shared_bots.pop(key).request.shutdown()
+
+
+@atexit.register
+def _close_sync_loop() -> None:
+    """Close the send_notification_sync loop and the Bots bound to it at exit."""
+    global _sync_loop
+    if _sync_loop is None:
+        return
+    
+    try:
+        _sync_loop.run_until_complete(close_shared_bot())
+    except Exception:
+        # Best-effort: log sinks may already be closed at interpreter exit
+        pass
+    _sync_loop.close()
+    _sync_loop = None
+
+
 class TelegramNotifier:
     """
     Handles sending notifications to Telegram with support for long messages.
     """
     
     MAX_MESSAGE_LENGTH = 4096  # Telegram's limit
+    CHUNK_LABEL_RESERVE = 16  # Room for the "(i/n)" prefix on split messages
+    # Telegram allows about 1 msg/s per chat, so concurrent chunks to one chat
+    # will trip flood control; _send_chunk waits out each RetryAfter
+    MAX_CONCURRENT_SENDS = 3
+    MAX_FLOOD_RETRIES = 5  # RetryAfter responses tolerated per chunk
     
     def __init__(self, bot_token: Optional[str] = None, chat_id: Optional[str] = None):
         """
@@ -33,9 +98,13 @@ class TelegramNotifier:
         if not self.chat_id:
             raise ValueError("TELEGRAM_CHAT_ID not found in environment")
         
-        self.bot = telegram.Bot(token=self.bot_token)
         logger.info(f"TelegramNotifier initialized for chat_id: {self.chat_id}")
     
+    @property
+    def bot(self) -> telegram.Bot:
+        """The shared Bot for the running event loop."""
+        return _get_bot(self.bot_token)
+    
     async def send_message(
         self,
         message: str,
@@ -57,31 +126,20 @@ class TelegramNotifier:
             # Split message if it's too long
             chunks = self._split_message(message)
             
-            for i, chunk in enumerate(chunks):
-                try:
-                    await self.bot.send_message(
-                        chat_id=self.chat_id,
-                        text=chunk,
-                        parse_mode=parse_mode,
-                        disable_web_page_preview=disable_preview
-                    )
-                    
-                    # Add small delay between chunks to avoid rate limiting
-                    if i < len(chunks) - 1:
-                        await asyncio.sleep(1)
-                        
-                except TelegramError as e:
-                    # If markdown parsing fails, try without formatting
-                    if "can't parse" in str(e).lower():
-                        logger.warning(f"Markdown parsing failed, sending as plain text")
-                        await self.bot.send_message(
-                            chat_id=self.chat_id,
-                            text=chunk,
-                            parse_mode=None,
-                            disable_web_page_preview=disable_preview
-                        )
-                    else:
-                        raise
+            # Chunks are sent concurrently, so number them to keep them readable
+            if len(chunks) > 1:
+                chunks = [
+                    f"({i}/{len(chunks)})\n{chunk}"
+                    for i, chunk in enumerate(chunks, 1)
+                ]
+            
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SENDS)
+            
+            async def send_chunk(chunk: str) -> None:
+                async with semaphore:
+                    await self._send_chunk(chunk, parse_mode, disable_preview)
+            
+            await asyncio.gather(*(send_chunk(chunk) for chunk in chunks))
             
             logger.info(f"Successfully sent {len(chunks)} message chunk(s)")
             return True
@@ -90,6 +148,51 @@ class TelegramNotifier:
             logger.error(f"Failed to send Telegram message: {e}")
             return False
     
+    async def _send_chunk(
+        self,
+        chunk: str,
+        parse_mode: Optional[str],
+        disable_preview: bool
+    ) -> None:
+        """
+        Send a single chunk.
+        
+        Waits and retries when Telegram's per-chat flood control answers with
+        RetryAfter, and retries as plain text if markdown is rejected.
+        """
+        flood_retries = 0
+        
+        # Every path either returns after a successful send or raises, so a
+        # chunk is never dropped silently
+        while True:
+            try:
+                await self.bot.send_message(
+                    chat_id=self.chat_id,
+                    text=chunk,
+                    parse_mode=parse_mode,
+                    disable_web_page_preview=disable_preview
+                )
+                return
+                
+            except RetryAfter as e:
+                flood_retries += 1
+                if flood_retries >= self.MAX_FLOOD_RETRIES:
+                    raise
+                delay = e.retry_after
+                if isinstance(delay, timedelta):
+                    delay = delay.total_seconds()
+                logger.warning(f"Telegram flood control, retrying chunk in {delay}s")
+                await asyncio.sleep(delay)
+                
+            except TelegramError as e:
+                # If markdown parsing fails, try without formatting (only once,
+                # since parse_mode is None afterwards)
+                if parse_mode is not None and "can't parse" in str(e).lower():
+                    logger.warning(f"Markdown parsing failed, sending as plain text")
+                    parse_mode = None
+                else:
+                    raise
+    
     def _split_message(self, message: str) -> List[str]:
         """
         Split a long message into chunks that fit Telegram's size limit.
@@ -103,34 +206,28 @@ class TelegramNotifier:
         if len(message) <= self.MAX_MESSAGE_LENGTH:
             return [message]
         
+        # Leave room for the chunk numbering added by send_message
+        max_length = self.MAX_MESSAGE_LENGTH - self.CHUNK_LABEL_RESERVE
         chunks = []
-        current_chunk = ""
+        start = 0
+        end = len(message)
         
-        # Split by lines to avoid breaking in the middle of content
-        lines = message.split('\n')
-        
-        for line in lines:
-            # If a single line is too long, split it
-            if len(line) > self.MAX_MESSAGE_LENGTH:
-                if current_chunk:
-                    chunks.append(current_chunk)
-                    current_chunk = ""
-                
-                # Split long line into smaller pieces
-                for i in range(0, len(line), self.MAX_MESSAGE_LENGTH - 100):
-                    chunks.append(line[i:i + self.MAX_MESSAGE_LENGTH - 100])
-            
-            # If adding this line would exceed the limit, start a new chunk
-            elif len(current_chunk) + len(line) + 1 > self.MAX_MESSAGE_LENGTH:
-                chunks.append(current_chunk)
-                current_chunk = line
-            
+        # Single pass: cut at the last newline inside each window so content
+        # isn't broken mid-line, falling back to a hard cut for long lines
+        while end - start > max_length:
+            cut = message.rfind('\n', start, start + max_length + 1)
+            if cut > start:
+                chunks.append(message[start:cut])
+                start = cut + 1
+            elif cut == start:
+                start += 1
             else:
-                current_chunk += ('\n' if current_chunk else '') + line
+                chunks.append(message[start:start + max_length])
+                start += max_length
         
         # Add the last chunk if it's not empty
-        if current_chunk:
-            chunks.append(current_chunk)
+        if start < end:
+            chunks.append(message[start:])
         
         return chunks
     
@@ -195,23 +292,24 @@ def send_notification_sync(message: str) -> bool:
     """
     Synchronous wrapper for sending Telegram notifications.
     
+    Sync callers share one notifier and one private event loop, so the
+    shared Bot's connection pool stays bound to a live loop between calls.
+    
     Args:
         message: Message to send
         
     Returns:
         True if successful, False otherwise
     """
-    notifier = TelegramNotifier()
+    global _sync_notifier, _sync_loop
+    if _sync_notifier is None:
+        _sync_notifier = TelegramNotifier()
     
     try:
-        # Create new event loop if none exists
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        if _sync_loop is None:
+            _sync_loop = asyncio.new_event_loop()
         
-        return loop.run_until_complete(notifier.send_message(message))
+        return _sync_loop.run_until_complete(_sync_notifier.send_message(message))
         
     except Exception as e:
         logger.error(f"Sync notification failed: {e}")
@@ -1,8 +1,9 @@
 """
 Basic tests for the research crew.
 """
+import asyncio
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from src.models import ResearchResult, ResearchSource
 
 
@@ -47,3 +48,168 @@ async def test_telegram_notifier_mock():
         
         # Verify call
         mock_bot_instance.send_message.assert_called()
+
+
+@pytest.mark.asyncio
+async def test_telegram_notifier_numbers_split_chunks():
+    """Test that split messages are numbered and all chunks are sent."""
+    with patch('src.telegram_notifier.telegram.Bot') as mock_bot:
+        from src.telegram_notifier import TelegramNotifier
+        
+        mock_bot_instance = MagicMock()
+        mock_bot_instance.send_message = AsyncMock()
+        mock_bot.return_value = mock_bot_instance
+        
+        notifier = TelegramNotifier(bot_token="dummy", chat_id="123")
+        
+        message = "\n".join(["x" * 100] * 100)
+        assert await notifier.send_message(message)
+        
+        texts = [call.kwargs["text"] for call in mock_bot_instance.send_message.call_args_list]
+        total = len(texts)
+        assert total > 1
+        assert sorted(text.split("\n", 1)[0] for text in texts) == sorted(
+            f"({i}/{total})" for i in range(1, total + 1)
+        )
+        assert all(len(text) <= TelegramNotifier.MAX_MESSAGE_LENGTH for text in texts)
+
+
+def test_caching_llm_reuses_similar_prompts():
+    """Test CachingLLM serves near-identical prompts from the cache."""
+    from src.llm_cache import CachingLLM
+    
+    base = MagicMock()
+    base.model = "gemini/test"
+    base.stop = []
+    base.call.return_value = "cached answer"
+    
+    vectors = {"summarize X": [1.0, 0.0], "summarize X.": [0.99, 0.05], "other": [0.0, 1.0]}
+    llm = CachingLLM(base, embed_fn=vectors.__getitem__, threshold=0.92)
+    
+    assert llm.call("summarize X") == "cached answer"
+    assert llm.call("summarize X.") == "cached answer"
+    assert base.call.call_count == 1
+    
+    llm.call("other")
+    assert base.call.call_count == 2
+    assert llm.hits == 1
+
+
+def test_load_yaml_header_drops_truncated_entry(tmp_path):
+    """Test the header loader keeps only complete top-level entries."""
+    from src.crew import MentalHealthResearchCrew
+    
+    config = tmp_path / "tasks.yaml"
+    config.write_text("first:\n  value: 1\nsecond:\n  value: " + "x" * 200 + "\n")
+    
+    assert MentalHealthResearchCrew._load_yaml_header(config, max_bytes=40) == {"first": {"value": 1}}
+    assert list(MentalHealthResearchCrew._load_yaml_header(config)) == ["first", "second"]
+
+
+def test_batch_search_tool_runs_each_query():
+    """Test BatchSerperDevTool returns results keyed by query."""
+    from src.search_tool import BatchSerperDevTool
+    
+    tool = BatchSerperDevTool(n_results=3)
+    with patch.object(BatchSerperDevTool, '_make_api_request', return_value={"organic": []}) as mock_request:
+        results = tool._run(search_queries=["llm therapy", "llm screening", "llm therapy"])
+    
+    assert list(results) == ["llm therapy", "llm screening"]
+    assert mock_request.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_telegram_notifier_retries_after_flood_control():
+    """Test a chunk is resent after Telegram answers with RetryAfter."""
+    with patch('src.telegram_notifier.telegram.Bot') as mock_bot:
+        from telegram.error import RetryAfter
+        from src.telegram_notifier import TelegramNotifier
+        
+        mock_bot_instance = MagicMock()
+        mock_bot_instance.send_message = AsyncMock(side_effect=[RetryAfter(0), None])
+        mock_bot.return_value = mock_bot_instance
+        
+        notifier = TelegramNotifier(bot_token="dummy", chat_id="123")
+        
+        assert await notifier.send_message("Test message")
+        assert mock_bot_instance.send_message.call_count == 2
+
+
+def test_caching_llm_misses_on_different_tool_result():
+    """Test transcripts sharing a long prefix don't match on a new tool result."""
+    from src.llm_cache import CachingLLM
+    
+    base = MagicMock()
+    base.model = "gemini/test"
+    base.stop = []
+    base.call.side_effect = ["Action: search", "Final Answer: done"]
+    
+    # Embedder that can't tell the messages apart, as with a truncated prefix
+    llm = CachingLLM(base, embed_fn=lambda text: [1.0, 0.0], threshold=0.92)
+    
+    prefix = [
+        {"role": "system", "content": "You are a researcher. " * 200},
+        {"role": "user", "content": "Current Task: find papers"},
+        {"role": "assistant", "content": "Action: search"},
+    ]
+    first = prefix + [{"role": "user", "content": "Observation: result A"}]
+    second = prefix + [
+        {"role": "user", "content": "Observation: result A"},
+        {"role": "assistant", "content": "Action: search"},
+        {"role": "user", "content": "Observation: result B"},
+    ]
+    
+    assert llm.call(first) == "Action: search"
+    assert llm.call(second) == "Final Answer: done"
+    assert base.call.call_count == 2
+    assert llm.hits == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_skips_overlapping_runs():
+    """Test a research run is skipped while another is in progress."""
+    with patch('src.scheduler.get_crew') as mock_get_crew, \
+            patch('src.scheduler.TelegramNotifier') as mock_notifier:
+        from src.scheduler import ResearchScheduler
+        
+        release = asyncio.Event()
+        
+        async def slow_execute():
+            await release.wait()
+            return MagicMock(status="success", report="report", execution_time_seconds=1.0)
+        
+        mock_get_crew.return_value.execute_async = AsyncMock(side_effect=slow_execute)
+        mock_notifier.return_value.send_report = AsyncMock()
+        
+        scheduler = ResearchScheduler()
+        first = asyncio.create_task(scheduler.execute_research())
+        await asyncio.sleep(0)
+        
+        await scheduler.execute_research()
+        release.set()
+        await first
+        
+        assert mock_get_crew.return_value.execute_async.call_count == 1
+        mock_notifier.return_value.send_report.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_telegram_notifier_markdown_fallback_after_flood_control():
+    """Test the plain-text fallback still sends after repeated RetryAfter."""
+    with patch('src.telegram_notifier.telegram.Bot') as mock_bot:
+        from telegram.error import BadRequest, RetryAfter
+        from src.telegram_notifier import TelegramNotifier
+        
+        mock_bot_instance = MagicMock()
+        mock_bot_instance.send_message = AsyncMock(side_effect=[
+            RetryAfter(0), RetryAfter(0), RetryAfter(0), RetryAfter(0),
+            BadRequest("Can't parse entities"),
+            None,
+        ])
+        mock_bot.return_value = mock_bot_instance
+        
+        notifier = TelegramNotifier(bot_token="dummy", chat_id="123")
+        
+        assert await notifier.send_message("Test *message")
+        assert mock_bot_instance.send_message.call_count == 6
+        assert mock_bot_instance.send_message.call_args.kwargs["parse_mode"] is None